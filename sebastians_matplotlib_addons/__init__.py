@@ -1,4 +1,5 @@
 from .version import __version__
+import functools
 import numpy as np
 import matplotlib
 import warnings
@@ -8,11 +9,14 @@ matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import matplotlib.colors as plt_colors
 import matplotlib.patches as plt_patches
+import matplotlib.collections as plt_collections
 
 
 from . import hemisphere
 from . import pseudo3d
 from . import video
+from . import async_writer
+from . import tiles
 
 FIGURE_16_9 = {"rows": 1080, "cols": 1920, "fontsize": 1}
 FIGURE_4_3 = {"rows": 1080, "cols": 1440, "fontsize": 1}
@@ -143,17 +147,110 @@ def ax_add_pie_slice(
 
 
 def ax_add_hexagon(ax, x, y, r_outer, orientation_deg=0.0, **kwargs):
-    xx = np.zeros(7)
-    yy = np.zeros(7)
-    ori = np.deg2rad(orientation_deg)
-    for i, phi in enumerate(np.linspace(0.0, 2.0 * np.pi, 7)):
-        _x = x + np.cos(phi + ori) * r_outer
-        _y = y + np.sin(phi + ori) * r_outer
-        xx[i] = _x
-        yy[i] = _y
+    hexagon = _unit_hexagon(orientation_deg=orientation_deg)
+    xx = x + r_outer * hexagon[:, 0]
+    yy = y + r_outer * hexagon[:, 1]
     ax.plot(xx, yy, **kwargs)
 
 
+def ax_add_hexagons(
+    ax,
+    x,
+    y,
+    r_outer,
+    orientation_deg=0.0,
+    values=None,
+    rgbas=None,
+    cmap=None,
+    norm=None,
+    **kwargs,
+):
+    """
+    Draws many filled hexagons, e.g. the pixels of a camera, as a single
+    PolyCollection.
+
+    Parameters
+    ----------
+    x : array (num_pixels)
+            Centers of the hexagons.
+    y : array (num_pixels)
+            Centers of the hexagons.
+    r_outer : float or array (num_pixels)
+            Outer radius of the hexagons.
+    orientation_deg : float
+            Orientation of all hexagons, same as in ax_add_hexagon().
+    values : array (num_pixels)
+            Mapped to colors using cmap and norm.
+    rgbas : array (num_pixels, 4)
+            Colors of the hexagons when values is None.
+    kwargs : dict
+            Passed on to matplotlib.collections.PolyCollection.
+
+    Returns
+    -------
+    collection : matplotlib.collections.PolyCollection
+            For the next image, update the pixels in place with
+            hexagons_set_values(collection, values) or
+            collection.set_facecolor(rgbas). Note that matplotlib fixes
+            vmin and vmax of the norm when the collection is drawn the
+            first time. A plain collection.set_array(values) keeps the
+            scale of the first image.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    assert x.shape == y.shape
+    r_outer = np.broadcast_to(np.asarray(r_outer, dtype=float), x.shape)
+
+    hexagon = _unit_hexagon(orientation_deg=orientation_deg)[0:6]
+    polygons = np.zeros(shape=(len(x), 6, 2))
+    polygons[:, :, 0] = x[:, np.newaxis] + np.outer(r_outer, hexagon[:, 0])
+    polygons[:, :, 1] = y[:, np.newaxis] + np.outer(r_outer, hexagon[:, 1])
+
+    collection = plt_collections.PolyCollection(polygons, **kwargs)
+    if values is not None:
+        collection.set_array(np.asarray(values))
+        collection.set_cmap(cmap)
+        collection.set_norm(norm)
+    elif rgbas is not None:
+        collection.set_facecolor(rgbas)
+    ax.add_collection(collection)
+    ax.autoscale_view()
+    return collection
+
+
+def hexagons_set_values(collection, values, autoscale=True):
+    """
+    Updates the values of the hexagons drawn by ax_add_hexagons() in place.
+
+    Parameters
+    ----------
+    collection : matplotlib.collections.PolyCollection
+            Returned by ax_add_hexagons().
+    values : array (num_pixels)
+            The new values.
+    autoscale : bool
+            If True, vmin and vmax of the norm are set to the range of the
+            new values. Set to False to keep the norm, e.g. a norm with
+            fixed vmin and vmax for a common scale of all images.
+    """
+    values = np.asarray(values)
+    assert len(values) == len(collection.get_paths())
+    collection.set_array(values)
+    if autoscale:
+        collection.autoscale()
+
+
+@functools.lru_cache(maxsize=None)
+def _unit_hexagon(orientation_deg):
+    """
+    Returns the closed outline (7, 2) of a hexagon with outer radius 1.
+    """
+    phi = np.linspace(0.0, 2.0 * np.pi, 7) + np.deg2rad(orientation_deg)
+    hexagon = np.stack([np.cos(phi), np.sin(phi)], axis=-1)
+    hexagon.setflags(write=False)
+    return hexagon
+
+
 def ax_add_hatches(
     ax,
     ix,
@@ -0,0 +1,137 @@
+import threading
+import concurrent.futures
+import numpy as np
+import matplotlib.image
+
+
+class AsyncFigureWriter:
+    """
+    Saves figures on a bounded pool of threads.
+
+    The figure is rendered on the caller's thread and its canvas-buffer is
+    copied. Only the compression and the writing of the file is done in
+    the pool. Right after savefig() returns, the figure can be closed or
+    reused.
+
+    Parameters
+    ----------
+    num_threads : int
+            Number of threads compressing and writing images.
+    max_pending : int
+            Maximum number of images which are copied but not yet written.
+            When reached, savefig() blocks until a slot is free.
+    """
+
+    def __init__(self, num_threads=2, max_pending=8):
+        assert num_threads > 0
+        assert max_pending > 0
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=num_threads
+        )
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._futures = []
+
+    def savefig(self, fig, path, format=None, metadata=None, pil_kwargs=None):
+        """
+        Render fig and write it to path asynchronously.
+
+        Unlike matplotlib's Figure.savefig(), the image is always the full
+        canvas as rendered by fig.canvas.draw(). Options such as bbox_inches,
+        facecolor or transparent are not supported. Set them on the figure
+        instead.
+
+        Parameters
+        ----------
+        fig : matplotlib.figure.Figure
+                Figure with an Agg canvas.
+        path : str, path
+                Path to write the image to. The extension defines the format.
+        format : str
+                Passed on to matplotlib.image.imsave().
+        metadata : dict
+                Passed on to matplotlib.image.imsave().
+        pil_kwargs : dict
+                Passed on to matplotlib.image.imsave().
+
+        Raises
+        ------
+        The first exception of any earlier write which has failed.
+        """
+        self._raise_on_failed_writes()
+
+        fig.canvas.draw()
+        rgba = np.array(fig.canvas.buffer_rgba(), dtype=np.uint8, copy=True)
+        dpi = fig.dpi
+
+        self._slots.acquire()
+        try:
+            future = self._pool.submit(
+                matplotlib.image.imsave,
+                path,
+                rgba,
+                dpi=dpi,
+                format=format,
+                metadata=metadata,
+                pil_kwargs=pil_kwargs,
+            )
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(self._release_slot)
+        self._futures.append(future)
+        return future
+
+    def flush(self):
+        """
+        Wait for all pending writes.
+
+        Raises
+        ------
+        The first exception of any write which has failed.
+        """
+        futures = self._futures
+        self._futures = []
+        concurrent.futures.wait(futures)
+        for future in futures:
+            exception = future.exception()
+            if exception is not None:
+                raise exception
+
+    def close(self):
+        """
+        Wait for all pending writes and shut down the pool.
+        """
+        try:
+            self.flush()
+        finally:
+            self._pool.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            # Do not replace the exception raised within the with-block
+            # by an exception of a pending write.
+            concurrent.futures.wait(self._futures)
+            self._futures = []
+            self._pool.shutdown(wait=True)
+
+    def _release_slot(self, future):
+        self._slots.release()
+
+    def _raise_on_failed_writes(self):
+        done = []
+        pending = []
+        for future in self._futures:
+            if future.done():
+                done.append(future)
+            else:
+                pending.append(future)
+        self._futures = pending
+        for future in done:
+            exception = future.exception()
+            if exception is not None:
+                raise exception
@@ -1,6 +1,7 @@
 import numpy as np
 import matplotlib.patches as plt_patches
 import matplotlib.colors as plt_colors
+import matplotlib.collections as plt_collections
 import spherical_coordinates
 
 
@@ -12,29 +13,215 @@ def ax_add_projected_points_with_colors(
     color=None,
     alpha=None,
     rgbas=None,
+    aggregate_above=100_000,
+    num_zenith_bins=32,
+    num_azimuth_bins=128,
+    aggregate=None,
 ):
+    """
+    Draws one projected circle for each direction. When aggregating, the
+    density of the directions is drawn instead using
+    ax_add_projected_points_density().
+
+    Parameters
+    ----------
+    aggregate : bool or None
+            If None, aggregate when there are more than aggregate_above
+            directions. If True or False, always or never aggregate. A frame
+            loop which updates the returned collection should set this so
+            that the kind of collection does not depend on the number of
+            directions in the first frame.
+
+    Returns
+    -------
+    collection : matplotlib.collections.Collection
+            Update the visibility in place with set_visible().
+            Without aggregation, this is an EllipseCollection with one
+            ellipse per direction. Update its colors and alphas with
+            set_facecolor(rgbas) for each direction.
+            With aggregation, this is a PolyCollection with one polygon per
+            cell. Its colors are per cell, not per direction. Update them
+            with set_facecolor(points_density_rgbas(...)) using the same
+            num_zenith_bins and num_azimuth_bins.
+    """
+    if aggregate is None:
+        aggregate = len(zeniths_rad) > aggregate_above
+
+    if aggregate:
+        return ax_add_projected_points_density(
+            ax=ax,
+            azimuths_rad=azimuths_rad,
+            zeniths_rad=zeniths_rad,
+            color=color,
+            alpha=alpha,
+            rgbas=rgbas,
+            num_zenith_bins=num_zenith_bins,
+            num_azimuth_bins=num_azimuth_bins,
+        )
+
+    azimuths_rad = np.asarray(azimuths_rad, dtype=float)
+    zeniths_rad = np.asarray(zeniths_rad, dtype=float)
+    assert azimuths_rad.shape == zeniths_rad.shape
+
+    if rgbas is None:
+        assert color is not None
+        assert alpha is not None
+        rgbas = np.zeros(shape=(len(zeniths_rad), 4))
+        rgbas[:, :] = plt_colors.to_rgba(color, alpha=alpha)
+
+    point_diameter = 2.0 * half_angle_rad
+    proj_radii = np.sin(zeniths_rad)
+    proj_x = np.cos(azimuths_rad) * proj_radii
+    proj_y = np.sin(azimuths_rad) * proj_radii
+
+    collection = plt_collections.EllipseCollection(
+        widths=point_diameter * np.cos(zeniths_rad),
+        heights=np.full(len(zeniths_rad), point_diameter),
+        angles=np.rad2deg(azimuths_rad),
+        units="xy",
+        offsets=np.stack([proj_x, proj_y], axis=-1),
+        offset_transform=ax.transData,
+        facecolors=rgbas,
+        linewidths=0.0,
+        zorder=2,
+    )
+    ax.add_collection(collection)
+    ax.autoscale_view()
+    return collection
+
+
+def ax_add_projected_points_density(
+    ax,
+    azimuths_rad,
+    zeniths_rad,
+    color=None,
+    alpha=None,
+    rgbas=None,
+    num_zenith_bins=32,
+    num_azimuth_bins=128,
+    num_steps=4,
+):
+    """
+    Histograms the directions into cells of equal solid angle and draws
+    all cells. See points_density_rgbas() for the colors of the cells.
+
+    Parameters
+    ----------
+    color : color
+            Color of all directions when rgbas is None.
+    alpha : float
+            Alpha of all directions when rgbas is None.
+    rgbas : array (num_directions, 4)
+            Color and alpha of each direction.
+    num_zenith_bins : int
+            Cells are equally spaced in cos(zenith) from 0 to 90deg.
+    num_azimuth_bins : int
+            Cells are equally spaced in azimuth.
+    num_steps : int
+            Number of steps along a cell's azimuth-edge.
+
+    Returns
+    -------
+    collection : matplotlib.collections.PolyCollection
+            One polygon for each of the num_zenith_bins * num_azimuth_bins
+            cells. Empty cells are fully transparent. The collection's
+            colors are per cell, not per direction. To show other
+            directions, update it with
+            set_facecolor(points_density_rgbas(...)).
+    """
+    cell_rgbas = points_density_rgbas(
+        azimuths_rad=azimuths_rad,
+        zeniths_rad=zeniths_rad,
+        color=color,
+        alpha=alpha,
+        rgbas=rgbas,
+        num_zenith_bins=num_zenith_bins,
+        num_azimuth_bins=num_azimuth_bins,
+    )
+
+    num_cells = num_zenith_bins * num_azimuth_bins
+    zenith_bin_edges = np.arccos(np.linspace(1.0, 0.0, num_zenith_bins + 1))
+    azimuth_bin_edges = np.linspace(0.0, 2.0 * np.pi, num_azimuth_bins + 1)
+    izs, ias = np.divmod(np.arange(num_cells), num_azimuth_bins)
+
+    steps = np.linspace(0.0, 1.0, num_steps + 1)
+    az_start = azimuth_bin_edges[ias]
+    az_stop = azimuth_bin_edges[ias + 1]
+    az_lower = az_start[:, np.newaxis] + np.outer(az_stop - az_start, steps)
+    polygon_azimuths = np.concatenate([az_lower, az_lower[:, ::-1]], axis=1)
+    polygon_zeniths = np.concatenate(
+        [
+            np.repeat(zenith_bin_edges[izs, np.newaxis], num_steps + 1, 1),
+            np.repeat(zenith_bin_edges[izs + 1, np.newaxis], num_steps + 1, 1),
+        ],
+        axis=1,
+    )
+    _x, _y = _transform(az=polygon_azimuths, zd=polygon_zeniths)
+
+    collection = plt_collections.PolyCollection(
+        np.stack([_x, _y], axis=-1),
+        facecolors=cell_rgbas,
+        edgecolors="none",
+        linewidths=0.0,
+        zorder=2,
+    )
+    ax.add_collection(collection)
+    ax.autoscale_view()
+    return collection
+
+
+def points_density_rgbas(
+    azimuths_rad,
+    zeniths_rad,
+    color=None,
+    alpha=None,
+    rgbas=None,
+    num_zenith_bins=32,
+    num_azimuth_bins=128,
+):
+    """
+    Returns the colors (num_zenith_bins * num_azimuth_bins, 4) of the cells
+    drawn by ax_add_projected_points_density(). A cell's color is the mean
+    color of its directions and its alpha is the mean alpha of its
+    directions scaled by the cell's count relative to the maximum count.
+    Empty cells have alpha 0.
+    """
+    azimuths_rad = np.asarray(azimuths_rad, dtype=float)
+    zeniths_rad = np.asarray(zeniths_rad, dtype=float)
+    assert azimuths_rad.shape == zeniths_rad.shape
+    num = len(zeniths_rad)
+    num_cells = num_zenith_bins * num_azimuth_bins
+
     if rgbas is not None:
-        _colors = rgbas[:, 0:3]
-        _alphas = rgbas[:, 3]
+        rgbas = np.asarray(rgbas, dtype=float)
+        assert rgbas.shape == (num, 4)
     else:
         assert color is not None
         assert alpha is not None
-        _colors = [color for i in range(len(zeniths))]
-        _alphas = [alpha for i in range(len(zeniths))]
+        rgbas = np.zeros(shape=(num, 4))
+        rgbas[:, 0:3] = plt_colors.to_rgb(color)
+        rgbas[:, 3] = alpha
 
-    for i in range(len(_colors)):
-        ax_add_projected_circle(
-            ax=ax,
-            azimuth_rad=azimuths_rad[i],
-            zenith_rad=zeniths_rad[i],
-            half_angle_rad=half_angle_rad,
-            linewidth=0.0,
-            fill=True,
-            zorder=2,
-            facecolor=_colors[i],
-            alpha=_alphas[i],
+    TAU = 2.0 * np.pi
+    iz = np.floor((1.0 - np.cos(zeniths_rad)) * num_zenith_bins)
+    iz = np.clip(iz, 0, num_zenith_bins - 1).astype(int)
+    ia = np.floor(np.mod(azimuths_rad, TAU) / TAU * num_azimuth_bins)
+    ia = np.clip(ia, 0, num_azimuth_bins - 1).astype(int)
+    cells = iz * num_azimuth_bins + ia
+
+    counts = np.bincount(cells, minlength=num_cells)
+    cell_rgbas = np.zeros(shape=(num_cells, 4))
+    for c in range(4):
+        cell_rgbas[:, c] = np.bincount(
+            cells, weights=rgbas[:, c], minlength=num_cells
         )
 
+    filled = counts > 0
+    cell_rgbas[filled] /= counts[filled, np.newaxis]
+    if np.any(filled):
+        cell_rgbas[:, 3] *= counts / np.max(counts)
+    return cell_rgbas
+
 
 def ax_add_projected_circle(
     ax, azimuth_rad, zenith_rad, half_angle_rad, **kwargs
@@ -98,49 +285,91 @@ def ax_add_plot(ax, azimuths_rad, zeniths_rad, **kwargs):
 
 
 def ax_add_faces(ax, azimuths_rad, zeniths_rad, faces, faces_colors):
-    azs = azimuths_rad
-    zds = zeniths_rad
-    for f in range(len(faces)):
-        face = faces[f]
-        a_az = azs[face[0]]
-        a_zd = zds[face[0]]
-
-        b_az = azs[face[1]]
-        b_zd = zds[face[1]]
-
-        c_az = azs[face[2]]
-        c_zd = zds[face[2]]
-
-        xx = np.zeros(3)
-        yy = np.zeros(3)
-
-        xx[0], yy[0] = _transform(az=a_az, zd=a_zd)
-        xx[1], yy[1] = _transform(az=b_az, zd=b_zd)
-        xx[2], yy[2] = _transform(az=c_az, zd=c_zd)
-
-        ax.fill(xx, yy, facecolor=faces_colors[f])
+    """
+    Draws the triangular faces as a single PolyCollection.
+
+    Returns
+    -------
+    collection : matplotlib.collections.PolyCollection
+            Update the colors, alphas and visibility in place with
+            set_facecolor(), set_alpha() and set_visible().
+    """
+    _x, _y = _transform_faces(
+        azimuths_rad=azimuths_rad, zeniths_rad=zeniths_rad, faces=faces
+    )
+    collection = plt_collections.PolyCollection(
+        np.stack([_x, _y], axis=-1),
+        facecolors=faces_colors,
+        edgecolors="none",
+    )
+    ax.add_collection(collection)
+    ax.autoscale_view()
+    return collection
 
 
 def ax_add_mesh(ax, azimuths_rad, zeniths_rad, faces, **kwargs):
-    azs = azimuths_rad
-    zds = zeniths_rad
-    for face in faces:
-        a_az = azs[face[0]]
-        a_zd = zds[face[0]]
-
-        b_az = azs[face[1]]
-        b_zd = zds[face[1]]
-
-        c_az = azs[face[2]]
-        c_zd = zds[face[2]]
-
-        aa = _transform(az=a_az, zd=a_zd)
-        bb = _transform(az=b_az, zd=b_zd)
-        cc = _transform(az=c_az, zd=c_zd)
-
-        ax.plot([aa[0], bb[0]], [aa[1], bb[1]], **kwargs)
-        ax.plot([bb[0], cc[0]], [bb[1], cc[1]], **kwargs)
-        ax.plot([cc[0], aa[0]], [cc[1], aa[1]], **kwargs)
+    """
+    Draws the edges of the triangular faces as a single LineCollection.
+    The kwargs are passed on to the LineCollection, e.g. color, linewidth,
+    linestyle, alpha. The ax.plot() kwargs c, lw, ls, dashes,
+    solid_capstyle, dash_capstyle, solid_joinstyle and dash_joinstyle are
+    translated to their LineCollection equivalents. Any other kwarg the
+    LineCollection does not have, e.g. marker or drawstyle, raises a
+    TypeError.
+
+    Returns
+    -------
+    collection : matplotlib.collections.LineCollection
+            Update the colors, alphas and visibility in place with
+            set_color(), set_alpha() and set_visible().
+    """
+    _x, _y = _transform_faces(
+        azimuths_rad=azimuths_rad, zeniths_rad=zeniths_rad, faces=faces
+    )
+    corners = np.stack([_x, _y], axis=-1)
+    segments = np.stack([corners, np.roll(corners, -1, axis=1)], axis=2)
+    collection = plt_collections.LineCollection(
+        segments.reshape(-1, 2, 2), **_plot_kwargs_to_line_collection(kwargs)
+    )
+    ax.add_collection(collection)
+    ax.autoscale_view()
+    return collection
+
+
+_PLOT_KWARGS_TO_LINE_COLLECTION = {
+    "c": "color",
+    "lw": "linewidth",
+    "ls": "linestyle",
+    "solid_capstyle": "capstyle",
+    "dash_capstyle": "capstyle",
+    "solid_joinstyle": "joinstyle",
+    "dash_joinstyle": "joinstyle",
+}
+
+
+def _plot_kwargs_to_line_collection(kwargs):
+    out = {}
+    for key in kwargs:
+        if key == "dashes":
+            out["linestyle"] = (0, kwargs[key])
+            continue
+        _key = _PLOT_KWARGS_TO_LINE_COLLECTION.get(key, key)
+        if not hasattr(plt_collections.LineCollection, "set_" + _key):
+            raise TypeError(
+                f"ax_add_mesh() draws a LineCollection which has no '{key}'."
+            )
+        out[_key] = kwargs[key]
+    return out
+
+
+def _transform_faces(azimuths_rad, zeniths_rad, faces):
+    """
+    Returns the projected x and y (num_faces, 3) of the faces' corners.
+    """
+    faces = np.asarray(faces, dtype=int).reshape(-1, 3)
+    azs = np.asarray(azimuths_rad, dtype=float)[faces]
+    zds = np.asarray(zeniths_rad, dtype=float)[faces]
+    return _transform(az=azs, zd=zds)
 
 
 def ax_add_grid_stellarium_style(ax, color="black", alpha=1.0, linewidth=0.05):
@@ -1,4 +1,6 @@
 import numpy as np
+import warnings
+import matplotlib.collections as plt_collections
 
 
 def transform(projection, v2):
@@ -177,3 +179,279 @@ def ax_add_mesh_intensity_to_alpha(
                 linewidth=linewidth,
                 alpha=alpha,
             )
+
+
+def ax_add_mesh_intensity_to_alpha_layers(
+    ax,
+    projections,
+    x_bin_edges,
+    y_bin_edges,
+    intensity_rgb,
+    linewidth=0.0,
+    threshold=0.0,
+    edgecolor="none",
+    gamma=1.0,
+    depths=None,
+):
+    """
+    Draws a stack of layers like ax_add_mesh_intensity_to_alpha() but with
+    all faces of all layers sorted back-to-front (painter's algorithm) and
+    added to ax as a single PolyCollection.
+
+    Parameters
+    ----------
+    projections : array (num_layers, 3, 3)
+            One projection for each layer, same as in
+            ax_add_mesh_intensity_to_alpha().
+    x_bin_edges : array (nx + 1)
+    y_bin_edges : array (ny + 1)
+    intensity_rgb : array (num_layers, nx, ny, 3)
+            Values in range [0, 1].
+    depths : array (num_layers)
+            Depth of each layer. Larger depth is further away and is drawn
+            first. Layers of equal depth are drawn in the order they are
+            given. Default is the layer's index, i.e. the first layer is in
+            the front and the last layer is in the back.
+
+    Returns
+    -------
+    collection : matplotlib.collections.PolyCollection
+    """
+    projections = np.asarray(projections)
+    intensity_rgb = np.asarray(intensity_rgb)
+    num_layers = intensity_rgb.shape[0]
+
+    assert projections.shape == (num_layers, 3, 3)
+    if depths is None:
+        depths = np.arange(num_layers)
+    depths = np.asarray(depths, dtype=float)
+    assert depths.shape == (num_layers,)
+    assert len(x_bin_edges) == intensity_rgb.shape[1] + 1
+    assert len(y_bin_edges) == intensity_rgb.shape[2] + 1
+
+    assert 1.0 > threshold >= 0.0
+    assert 0.0 < gamma
+
+    polygons = _bin_edges_to_polygons(x_bin_edges, y_bin_edges)
+    facecolors, mask = _intensity_rgb_to_facecolors(
+        intensity_rgb=intensity_rgb, threshold=threshold, gamma=gamma
+    )
+
+    # (num_layers, nx * ny, 4, 2)
+    tpolygons = _transform_points(projections=projections, points=polygons)
+    face_depths = np.repeat(depths[:, np.newaxis], len(polygons), axis=1)
+
+    tpolygons = tpolygons[mask.reshape(num_layers, -1)]
+    facecolors = facecolors[mask]
+    face_depths = face_depths[mask.reshape(num_layers, -1)]
+
+    order = np.argsort(-face_depths, kind="stable")
+
+    collection = plt_collections.PolyCollection(
+        tpolygons[order],
+        facecolors=facecolors[order],
+        edgecolors=edgecolor,
+        linewidths=linewidth,
+    )
+    ax.add_collection(collection)
+    ax.autoscale_view()
+    return collection
+
+
+def _transform_points(projections, points):
+    """
+    Returns the projected points (num_projections, ..., 2) for points
+    (..., 2). Like transform(), the third component is discarded.
+    """
+    projections = np.asarray(projections)
+    points = np.asarray(points, dtype=float)
+    shape = points.shape[:-1]
+    flat = points.reshape(-1, 2)
+    homogeneous = np.ones(shape=(3, flat.shape[0]))
+    homogeneous[0:2, :] = flat.T
+    tv = np.matmul(projections, homogeneous)
+    tpoints = np.moveaxis(tv[:, 0:2, :], 1, 2)
+    return tpoints.reshape((projections.shape[0],) + shape + (2,))
+
+
+def _bin_edges_to_polygons(x_bin_edges, y_bin_edges):
+    """
+    Returns the polygons (nx * ny, 4, 2) of the bins in the same order and
+    orientation as ax_add_mesh_intensity_to_alpha() draws them.
+    """
+    x_bin_edges = np.asarray(x_bin_edges, dtype=float)
+    y_bin_edges = np.asarray(y_bin_edges, dtype=float)
+    x_start, y_start = np.meshgrid(
+        x_bin_edges[:-1], y_bin_edges[:-1], indexing="ij"
+    )
+    x_stop, y_stop = np.meshgrid(
+        x_bin_edges[1:], y_bin_edges[1:], indexing="ij"
+    )
+    polygons = np.zeros(shape=(x_start.size, 4, 2))
+    polygons[:, :, 0] = np.stack(
+        [x_start, x_start, x_stop, x_stop], axis=-1
+    ).reshape(-1, 4)
+    polygons[:, :, 1] = np.stack(
+        [y_start, y_stop, y_stop, y_start], axis=-1
+    ).reshape(-1, 4)
+    return polygons
+
+
+def _intensity_rgb_to_facecolors(intensity_rgb, threshold, gamma):
+    """
+    Returns the flat rgba facecolors (..., 4) and the mask (...) of the
+    bins which are above the threshold.
+    """
+    rgb = np.asarray(intensity_rgb, dtype=float)[..., 0:3]
+
+    num_out_of_range = np.sum(
+        np.logical_or(np.min(rgb, axis=-1) < 0.0, np.max(rgb, axis=-1) > 1.0)
+    )
+    if num_out_of_range:
+        warnings.warn(
+            f"intensity_rgb has {num_out_of_range:d} bins out of range [0,1].",
+            RuntimeWarning,
+        )
+
+    rgb_norm = np.max(rgb, axis=-1)
+    mask = rgb_norm >= threshold
+
+    rgbas = np.zeros(shape=rgb.shape[:-1] + (4,))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rgbas[..., 0:3] = rgb / rgb_norm[..., np.newaxis]
+    rgbas[..., 3] = np.clip(rgb_norm, 0.0, None) ** gamma
+    rgbas = np.clip(np.nan_to_num(rgbas), 0.0, 1.0)
+    return rgbas, mask
+
+
+def transform_stack(projections, xs, ys):
+    """
+    Transforms the points (xs, ys) with each of the N projections in one
+    batched operation.
+
+    Parameters
+    ----------
+    projections : array (N, 3, 3)
+    xs : array (M)
+    ys : array (M)
+
+    Returns
+    -------
+    txs, tys : arrays (N, M)
+    """
+    assert len(xs) == len(ys)
+    points = np.stack([xs, ys], axis=-1)
+    tpoints = _transform_points(projections=projections, points=points)
+    return tpoints[..., 0], tpoints[..., 1]
+
+
+def mesh_segments_stack(projections, mesh):
+    """
+    Returns the segments (N, num_edges, 2, 2) of the mesh's edges for each
+    of the N projections. Same orientation as ax_add_mesh().
+    """
+    vertices = np.asarray(mesh["vertices"], dtype=float)
+    edges = np.asarray(mesh["edges"], dtype=int)
+    points = np.zeros(shape=(len(edges), 2, 2))
+    points[:, :, 0] = vertices[edges, 1]
+    points[:, :, 1] = -vertices[edges, 0]
+    tpoints = _transform_points(projections=projections, points=points)
+    return tpoints
+
+
+def grid_segments_stack(projections, x_bin_edges, y_bin_edges):
+    """
+    Returns the segments (N, nx + ny, 2, 2) of the grid's lines for each of
+    the N projections. Same lines as ax_add_grid().
+    """
+    x_bin_edges = np.asarray(x_bin_edges, dtype=float)
+    y_bin_edges = np.asarray(y_bin_edges, dtype=float)
+    xmin = np.min(x_bin_edges)
+    xmax = np.max(x_bin_edges)
+    ymin = np.min(y_bin_edges)
+    ymax = np.max(y_bin_edges)
+
+    num_x = len(x_bin_edges)
+    points = np.zeros(shape=(num_x + len(y_bin_edges), 2, 2))
+    points[:num_x, :, 0] = x_bin_edges[:, np.newaxis]
+    points[:num_x, 0, 1] = ymin
+    points[:num_x, 1, 1] = ymax
+    points[num_x:, 0, 0] = xmin
+    points[num_x:, 1, 0] = xmax
+    points[num_x:, :, 1] = y_bin_edges[:, np.newaxis]
+    tpoints = _transform_points(projections=projections, points=points)
+    return tpoints
+
+
+def mesh_intensity_polygons_stack(projections, x_bin_edges, y_bin_edges):
+    """
+    Returns the polygons (N, nx * ny, 4, 2) of the bins for each of the N
+    projections. To be drawn with ax_add_mesh_intensity_to_alpha_polygons().
+    """
+    polygons = _bin_edges_to_polygons(x_bin_edges, y_bin_edges)
+    tpolygons = _transform_points(projections=projections, points=polygons)
+    return tpolygons
+
+
+def ax_add_segments(
+    ax,
+    segments,
+    alpha=0.66,
+    linewidth=0.1,
+    color="k",
+    linestyle="-",
+):
+    """
+    Draws already projected segments (num_segments, 2, 2), e.g. one frame
+    of mesh_segments_stack() or grid_segments_stack(), as a single
+    LineCollection. Use the returned collection's set_segments() to update
+    it for the next frame.
+    """
+    collection = plt_collections.LineCollection(
+        segments,
+        linestyles=linestyle,
+        alpha=alpha,
+        linewidths=linewidth,
+        colors=color,
+    )
+    ax.add_collection(collection)
+    ax.autoscale_view()
+    return collection
+
+
+def ax_add_mesh_intensity_to_alpha_polygons(
+    ax,
+    polygons,
+    intensity_rgb,
+    linewidth=0.0,
+    threshold=0.0,
+    edgecolor="none",
+    gamma=1.0,
+):
+    """
+    Like ax_add_mesh_intensity_to_alpha() but with already projected
+    polygons (nx * ny, 4, 2), e.g. one frame of
+    mesh_intensity_polygons_stack(). Draws a single PolyCollection.
+    The collection keeps all nx * ny polygons. Bins below the threshold
+    are fully transparent. So the collection can be updated for the next
+    frame with set_verts(polygons).
+    """
+    intensity_rgb = np.asarray(intensity_rgb)
+    assert len(polygons) == intensity_rgb.shape[0] * intensity_rgb.shape[1]
+
+    assert 1.0 > threshold >= 0.0
+    assert 0.0 < gamma
+
+    facecolors, mask = _intensity_rgb_to_facecolors(
+        intensity_rgb=intensity_rgb, threshold=threshold, gamma=gamma
+    )
+    facecolors[np.logical_not(mask), 3] = 0.0
+    collection = plt_collections.PolyCollection(
+        polygons,
+        facecolors=facecolors.reshape(-1, 4),
+        edgecolors=edgecolor,
+        linewidths=linewidth,
+    )
+    ax.add_collection(collection)
+    ax.autoscale_view()
+    return collection
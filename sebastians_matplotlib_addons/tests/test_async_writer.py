@@ -0,0 +1,47 @@
+import sebastians_matplotlib_addons as sebplt
+import matplotlib.image
+import os
+import pytest
+
+STYLE = {"rows": 120, "cols": 160, "fontsize": 1}
+
+
+def test_savefig_and_close_figure_right_away(tmp_path):
+    with sebplt.async_writer.AsyncFigureWriter(max_pending=2) as writer:
+        for i in range(5):
+            fig = sebplt.figure(style=STYLE, dpi=40)
+            ax = sebplt.add_axes(fig=fig, span=[0.1, 0.1, 0.8, 0.8])
+            ax.plot([0, 1], [0, i])
+            writer.savefig(fig, os.path.join(tmp_path, f"{i:06d}.png"))
+            sebplt.close(fig)
+
+    for i in range(5):
+        img = matplotlib.image.imread(os.path.join(tmp_path, f"{i:06d}.png"))
+        assert img.shape == (STYLE["rows"], STYLE["cols"], 4)
+
+
+def test_flush_raises_failed_write(tmp_path):
+    writer = sebplt.async_writer.AsyncFigureWriter()
+    fig = sebplt.figure(style=STYLE, dpi=40)
+    writer.savefig(fig, os.path.join(tmp_path, "no_such_dir", "a.png"))
+    sebplt.close(fig)
+    with pytest.raises(FileNotFoundError):
+        writer.flush()
+    writer.close()
+
+
+def test_figure_savefig_kwargs_are_rejected_right_away(tmp_path):
+    with sebplt.async_writer.AsyncFigureWriter() as writer:
+        fig = sebplt.figure(style=STYLE, dpi=40)
+        with pytest.raises(TypeError):
+            writer.savefig(fig, os.path.join(tmp_path, "a.png"), dpi=40)
+        sebplt.close(fig)
+
+
+def test_exception_in_with_block_is_not_replaced(tmp_path):
+    with pytest.raises(KeyError):
+        with sebplt.async_writer.AsyncFigureWriter() as writer:
+            fig = sebplt.figure(style=STYLE, dpi=40)
+            writer.savefig(fig, os.path.join(tmp_path, "no_dir", "a.png"))
+            sebplt.close(fig)
+            raise KeyError("in with-block")
@@ -0,0 +1,193 @@
+import sebastians_matplotlib_addons as sebplt
+import numpy as np
+import pytest
+
+
+def test_many_points_are_aggregated_into_cells():
+    prng = np.random.Generator(np.random.PCG64(1))
+    num = 1000
+    azimuths_rad = prng.uniform(low=0.0, high=2.0 * np.pi, size=num)
+    zeniths_rad = np.arccos(prng.uniform(low=0.0, high=1.0, size=num))
+
+    fig = sebplt.figure(style={"rows": 100, "cols": 100, "fontsize": 1})
+    ax = sebplt.add_axes(fig=fig, span=[0, 0, 1, 1])
+    sebplt.hemisphere.ax_add_projected_points_with_colors(
+        ax=ax,
+        azimuths_rad=azimuths_rad,
+        zeniths_rad=zeniths_rad,
+        half_angle_rad=0.01,
+        color="red",
+        alpha=0.5,
+        aggregate_above=100,
+        num_zenith_bins=2,
+        num_azimuth_bins=4,
+    )
+    assert len(ax.patches) == 0
+    assert len(ax.collections) == 1
+    rgbas = ax.collections[0].get_facecolors()
+    assert rgbas.shape == (2 * 4, 4)
+    np.testing.assert_array_almost_equal(rgbas[:, 0:3], [[1, 0, 0]] * 8)
+    assert np.max(rgbas[:, 3]) == 0.5
+    sebplt.close(fig)
+
+
+def test_handles_update_colors_in_place():
+    azimuths_rad = np.deg2rad([0, 90, 180, 270, 0])
+    zeniths_rad = np.deg2rad([45, 45, 45, 45, 0])
+    faces = [[0, 1, 4], [1, 2, 4], [2, 3, 4], [3, 0, 4]]
+
+    fig = sebplt.figure(style={"rows": 100, "cols": 100, "fontsize": 1})
+    ax = sebplt.add_axes(fig=fig, span=[0, 0, 1, 1])
+    faces_handle = sebplt.hemisphere.ax_add_faces(
+        ax=ax,
+        azimuths_rad=azimuths_rad,
+        zeniths_rad=zeniths_rad,
+        faces=faces,
+        faces_colors=["red"] * 4,
+    )
+    mesh_handle = sebplt.hemisphere.ax_add_mesh(
+        ax=ax,
+        azimuths_rad=azimuths_rad,
+        zeniths_rad=zeniths_rad,
+        faces=faces,
+        color="black",
+    )
+    points_handle = sebplt.hemisphere.ax_add_projected_points_with_colors(
+        ax=ax,
+        azimuths_rad=azimuths_rad,
+        zeniths_rad=zeniths_rad,
+        half_angle_rad=0.01,
+        color="blue",
+        alpha=0.5,
+    )
+    assert len(ax.collections) == 3
+    assert len(faces_handle.get_paths()) == 4
+    assert len(mesh_handle.get_segments()) == 4 * 3
+    assert len(points_handle.get_offsets()) == 5
+
+    faces_handle.set_facecolor([[0, 1, 0, 1]] * 4)
+    points_handle.set_visible(False)
+    fig.canvas.draw()
+    np.testing.assert_array_equal(
+        faces_handle.get_facecolor(), [[0, 1, 0, 1]] * 4
+    )
+    sebplt.close(fig)
+
+
+def test_aggregated_handle_is_updated_per_cell():
+    num_zenith_bins = 3
+    num_azimuth_bins = 4
+    num_cells = num_zenith_bins * num_azimuth_bins
+    fig = sebplt.figure(style={"rows": 100, "cols": 100, "fontsize": 1})
+    ax = sebplt.add_axes(fig=fig, span=[0, 0, 1, 1])
+
+    # all directions in the cell at the zenith with azimuth [0, 90)deg.
+    handle = sebplt.hemisphere.ax_add_projected_points_with_colors(
+        ax=ax,
+        azimuths_rad=np.deg2rad(np.full(20, 45.0)),
+        zeniths_rad=np.deg2rad(np.full(20, 1.0)),
+        half_angle_rad=0.01,
+        color="red",
+        alpha=1.0,
+        aggregate_above=10,
+        num_zenith_bins=num_zenith_bins,
+        num_azimuth_bins=num_azimuth_bins,
+    )
+    assert len(handle.get_paths()) == num_cells
+    assert np.sum(handle.get_facecolor()[:, 3] > 0) == 1
+    assert handle.get_facecolor()[0, 3] == 1.0
+
+    # next frame: directions move to the cell with azimuth [180, 270)deg.
+    rgbas = np.zeros(shape=(30, 4))
+    rgbas[:, 2] = 1.0
+    rgbas[:, 3] = 0.5
+    cell_rgbas = sebplt.hemisphere.points_density_rgbas(
+        azimuths_rad=np.deg2rad(np.full(30, 200.0)),
+        zeniths_rad=np.deg2rad(np.full(30, 1.0)),
+        rgbas=rgbas,
+        num_zenith_bins=num_zenith_bins,
+        num_azimuth_bins=num_azimuth_bins,
+    )
+    assert cell_rgbas.shape == (num_cells, 4)
+    handle.set_facecolor(cell_rgbas)
+    fig.canvas.draw()
+    np.testing.assert_array_almost_equal(
+        handle.get_facecolor()[2], [0, 0, 1, 0.5]
+    )
+    assert np.sum(handle.get_facecolor()[:, 3] > 0) == 1
+    sebplt.close(fig)
+
+
+def test_mesh_accepts_plot_aliases_and_rejects_markers():
+    azimuths_rad = np.deg2rad([0, 90, 0])
+    zeniths_rad = np.deg2rad([45, 45, 0])
+    faces = [[0, 1, 2]]
+
+    fig = sebplt.figure(style={"rows": 100, "cols": 100, "fontsize": 1})
+    ax = sebplt.add_axes(fig=fig, span=[0, 0, 1, 1])
+    handle = sebplt.hemisphere.ax_add_mesh(
+        ax=ax,
+        azimuths_rad=azimuths_rad,
+        zeniths_rad=zeniths_rad,
+        faces=faces,
+        c="red",
+        lw=2.0,
+        ls="--",
+    )
+    np.testing.assert_array_equal(handle.get_color(), [[1, 0, 0, 1]])
+    assert handle.get_linewidth()[0] == 2.0
+
+    handle = sebplt.hemisphere.ax_add_mesh(
+        ax=ax,
+        azimuths_rad=azimuths_rad,
+        zeniths_rad=zeniths_rad,
+        faces=faces,
+        solid_capstyle="round",
+        dashes=[2, 1],
+    )
+    assert handle.get_capstyle() == "round"
+    fig.canvas.draw()
+
+    for line2d_only in [{"marker": "o"}, {"drawstyle": "steps"}]:
+        with pytest.raises(TypeError):
+            sebplt.hemisphere.ax_add_mesh(
+                ax=ax,
+                azimuths_rad=azimuths_rad,
+                zeniths_rad=zeniths_rad,
+                faces=faces,
+                **line2d_only,
+            )
+    sebplt.close(fig)
+
+
+def test_aggregate_overrides_aggregate_above():
+    prng = np.random.Generator(np.random.PCG64(4))
+    fig = sebplt.figure(style={"rows": 100, "cols": 100, "fontsize": 1})
+    ax = sebplt.add_axes(fig=fig, span=[0, 0, 1, 1])
+
+    kinds = []
+    for num, aggregate in [(5, True), (50, True), (5, False), (50, False)]:
+        handle = sebplt.hemisphere.ax_add_projected_points_with_colors(
+            ax=ax,
+            azimuths_rad=prng.uniform(low=0.0, high=2.0 * np.pi, size=num),
+            zeniths_rad=prng.uniform(low=0.0, high=1.0, size=num),
+            half_angle_rad=0.01,
+            color="red",
+            alpha=0.5,
+            aggregate_above=10,
+            num_zenith_bins=2,
+            num_azimuth_bins=4,
+            aggregate=aggregate,
+        )
+        kinds.append(type(handle).__name__)
+        if aggregate:
+            assert len(handle.get_paths()) == 2 * 4
+        else:
+            assert len(handle.get_offsets()) == num
+    assert kinds == [
+        "PolyCollection",
+        "PolyCollection",
+        "EllipseCollection",
+        "EllipseCollection",
+    ]
+    sebplt.close(fig)
@@ -0,0 +1,65 @@
+import sebastians_matplotlib_addons as sebplt
+import matplotlib
+import numpy as np
+
+
+def test_hexagons_in_one_collection_and_update_values():
+    num = 1000
+    prng = np.random.Generator(np.random.PCG64(3))
+    x = prng.uniform(size=num)
+    y = prng.uniform(size=num)
+
+    fig = sebplt.figure(style={"rows": 100, "cols": 100, "fontsize": 1})
+    ax = sebplt.add_axes(fig=fig, span=[0, 0, 1, 1])
+    collection = sebplt.ax_add_hexagons(
+        ax=ax,
+        x=x,
+        y=y,
+        r_outer=0.01,
+        orientation_deg=30.0,
+        values=prng.uniform(size=num),
+        cmap="viridis",
+    )
+    assert len(ax.collections) == 1
+    paths = collection.get_paths()
+    assert len(paths) == num
+    np.testing.assert_array_almost_equal(
+        np.linalg.norm(paths[0].vertices[0] - [x[0], y[0]]), 0.01
+    )
+    fig.canvas.draw()
+
+    # next event with a different scale
+    new_values = prng.uniform(low=0, high=100, size=num)
+    sebplt.hexagons_set_values(collection, new_values)
+    fig.canvas.draw()
+    np.testing.assert_array_equal(collection.get_array(), new_values)
+
+    cmap = matplotlib.colormaps["viridis"]
+    normed = (new_values - np.min(new_values)) / np.ptp(new_values)
+    np.testing.assert_array_almost_equal(
+        collection.get_facecolor(), cmap(normed)
+    )
+    sebplt.close(fig)
+
+
+def test_hexagons_keep_fixed_norm():
+    fig = sebplt.figure(style={"rows": 100, "cols": 100, "fontsize": 1})
+    ax = sebplt.add_axes(fig=fig, span=[0, 0, 1, 1])
+    collection = sebplt.ax_add_hexagons(
+        ax=ax,
+        x=[0, 1],
+        y=[0, 0],
+        r_outer=0.5,
+        values=[0.0, 1.0],
+        cmap="viridis",
+        norm=matplotlib.colors.Normalize(vmin=0, vmax=10),
+    )
+    fig.canvas.draw()
+    sebplt.hexagons_set_values(collection, [0.0, 5.0], autoscale=False)
+    fig.canvas.draw()
+
+    cmap = matplotlib.colormaps["viridis"]
+    np.testing.assert_array_almost_equal(
+        collection.get_facecolor(), cmap([0.0, 0.5])
+    )
+    sebplt.close(fig)
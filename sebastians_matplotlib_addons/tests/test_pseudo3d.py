@@ -0,0 +1,135 @@
+import sebastians_matplotlib_addons as sebplt
+import numpy as np
+import pytest
+
+
+def _affine_layer_projections(num_layers):
+    projections = np.array([np.eye(3) for i in range(num_layers)])
+    for i in range(num_layers):
+        projections[i, 1, 2] = i
+    return projections
+
+
+def test_layers_are_drawn_back_to_front():
+    prng = np.random.Generator(np.random.PCG64(1))
+    num_layers = 3
+    intensity_rgb = prng.uniform(size=(num_layers, 4, 5, 3))
+
+    fig = sebplt.figure(style={"rows": 100, "cols": 100, "fontsize": 1})
+    ax = sebplt.add_axes(fig=fig, span=[0, 0, 1, 1])
+    collection = sebplt.pseudo3d.ax_add_mesh_intensity_to_alpha_layers(
+        ax=ax,
+        projections=_affine_layer_projections(num_layers),
+        x_bin_edges=np.linspace(0, 1, 5),
+        y_bin_edges=np.linspace(0, 1, 6),
+        intensity_rgb=intensity_rgb,
+        depths=[1.0, 3.0, 2.0],
+    )
+    paths = collection.get_paths()
+    assert len(paths) == num_layers * 4 * 5
+
+    # layer 1 is furthest away, then layer 2, then layer 0.
+    y_shifts = [np.min(path.vertices[:, 1]) for path in paths]
+    assert np.floor(y_shifts[0]) == 1
+    assert np.floor(y_shifts[20]) == 2
+    assert np.floor(y_shifts[-1]) == 0
+    sebplt.close(fig)
+
+
+def test_layers_default_depth_is_layer_index():
+    num_layers = 3
+    fig = sebplt.figure(style={"rows": 100, "cols": 100, "fontsize": 1})
+    ax = sebplt.add_axes(fig=fig, span=[0, 0, 1, 1])
+    collection = sebplt.pseudo3d.ax_add_mesh_intensity_to_alpha_layers(
+        ax=ax,
+        projections=_affine_layer_projections(num_layers),
+        x_bin_edges=np.linspace(0, 1, 3),
+        y_bin_edges=np.linspace(0, 1, 3),
+        intensity_rgb=np.ones(shape=(num_layers, 2, 2, 3)),
+    )
+    # the last layer is in the back and drawn first.
+    y_shifts = [np.min(path.vertices[:, 1]) for path in collection.get_paths()]
+    np.testing.assert_array_equal(
+        np.floor(y_shifts), [2, 2, 2, 2, 1, 1, 1, 1, 0, 0, 0, 0]
+    )
+    sebplt.close(fig)
+
+
+def test_intensity_out_of_range_warns():
+    fig = sebplt.figure(style={"rows": 100, "cols": 100, "fontsize": 1})
+    ax = sebplt.add_axes(fig=fig, span=[0, 0, 1, 1])
+    with pytest.warns(RuntimeWarning):
+        sebplt.pseudo3d.ax_add_mesh_intensity_to_alpha_layers(
+            ax=ax,
+            projections=_affine_layer_projections(1),
+            x_bin_edges=np.linspace(0, 1, 3),
+            y_bin_edges=np.linspace(0, 1, 3),
+            intensity_rgb=2.0 * np.ones(shape=(1, 2, 2, 3)),
+        )
+    sebplt.close(fig)
+
+
+def test_stack_of_projections_matches_single_transform():
+    prng = np.random.Generator(np.random.PCG64(2))
+    num_frames = 7
+    projections = prng.uniform(low=-1, high=1, size=(num_frames, 3, 3))
+    mesh = {
+        "vertices": prng.uniform(size=(5, 3)),
+        "edges": [[0, 1], [1, 2], [2, 3], [3, 4]],
+    }
+    x_bin_edges = np.linspace(0, 1, 4)
+    y_bin_edges = np.linspace(0, 2, 3)
+
+    mesh_segments = sebplt.pseudo3d.mesh_segments_stack(projections, mesh)
+    assert mesh_segments.shape == (num_frames, 4, 2, 2)
+    grid_segments = sebplt.pseudo3d.grid_segments_stack(
+        projections, x_bin_edges, y_bin_edges
+    )
+    assert grid_segments.shape == (num_frames, 4 + 3, 2, 2)
+
+    for n in range(num_frames):
+        for e, edge in enumerate(mesh["edges"]):
+            for i in range(2):
+                vertex = mesh["vertices"][edge[i]]
+                expected = sebplt.pseudo3d.transform(
+                    projections[n], [vertex[1], -vertex[0]]
+                )
+                np.testing.assert_array_almost_equal(
+                    mesh_segments[n, e, i], expected
+                )
+        expected = sebplt.pseudo3d.transform(projections[n], [1.0, 2.0])
+        np.testing.assert_array_almost_equal(grid_segments[n, 3, 1], expected)
+
+
+def test_polygons_keep_bins_below_threshold_for_set_verts():
+    num_frames = 2
+    projections = np.array([np.eye(3) for i in range(num_frames)])
+    projections[1, 0, 2] = 10.0
+    polygons = sebplt.pseudo3d.mesh_intensity_polygons_stack(
+        projections, x_bin_edges=[0, 1, 2], y_bin_edges=[0, 1, 2, 3]
+    )
+    intensity_rgb = np.zeros(shape=(2, 3, 3))
+    intensity_rgb[0, 1] = [1.0, 0.0, 0.0]
+    intensity_rgb[1, 2] = [0.0, 0.0, 0.8]
+
+    fig = sebplt.figure(style={"rows": 100, "cols": 100, "fontsize": 1})
+    ax = sebplt.add_axes(fig=fig, span=[0, 0, 1, 1])
+    collection = sebplt.pseudo3d.ax_add_mesh_intensity_to_alpha_polygons(
+        ax=ax,
+        polygons=polygons[0],
+        intensity_rgb=intensity_rgb,
+        threshold=0.5,
+    )
+    collection.set_verts(polygons[1])
+    fig.canvas.draw()
+
+    rgbas = collection.get_facecolor()
+    assert len(collection.get_paths()) == len(rgbas) == 2 * 3
+    visible = np.nonzero(rgbas[:, 3] > 0.0)[0]
+    np.testing.assert_array_equal(visible, [1, 5])
+    np.testing.assert_array_almost_equal(rgbas[1], [1, 0, 0, 1])
+    np.testing.assert_array_almost_equal(rgbas[5], [0, 0, 1, 0.8])
+    np.testing.assert_array_almost_equal(
+        collection.get_paths()[5].vertices[0], [11, 2]
+    )
+    sebplt.close(fig)
@@ -0,0 +1,37 @@
+import sebastians_matplotlib_addons as sebplt
+import numpy as np
+import matplotlib
+import os
+
+
+def _plot(fig):
+    ax = sebplt.add_axes(fig=fig, span=[0.1, 0.1, 0.8, 0.8])
+    ax.plot(np.arange(100) ** 0.5, color="red")
+    ax.set_title("title across seams")
+    ax.set_xlabel("x")
+    sebplt.ax_add_circle(ax=ax, x=50, y=5, r=3, color="k")
+
+
+def test_tiled_image_matches_full_image(tmp_path):
+    style = sebplt.FIGURE_16_9
+    image = sebplt.tiles.render_tiled(
+        plot=_plot,
+        path=os.path.join(tmp_path, "poster.npy"),
+        style=style,
+        dpi=240,
+        tile_rows=300,
+        tile_cols=700,
+        num_processes=4,
+    )
+    assert image.shape == (style["rows"], style["cols"], 4)
+
+    with matplotlib.rc_context(sebplt.tiles.TILE_RC_PARAMS):
+        fig = sebplt.figure(style=style, dpi=240)
+        _plot(fig)
+        fig.canvas.draw()
+        full = np.asarray(fig.canvas.buffer_rgba())
+        sebplt.close(fig)
+
+    # tiles are not aligned with the figure's axes, text or lines.
+    diff = np.abs(image.astype(int) - full.astype(int))
+    assert np.max(diff) <= 1
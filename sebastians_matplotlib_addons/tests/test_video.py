@@ -0,0 +1,72 @@
+import sebastians_matplotlib_addons as sebplt
+import os
+
+
+def test_runs_of_identical_images_are_collapsed(tmp_path):
+    wildcard = os.path.join(tmp_path, "%06d.png")
+    contents = [b"a", b"a", b"a", b"b", b"a", b"a"]
+    for i, content in enumerate(contents):
+        with open(wildcard % i, "wb") as f:
+            f.write(content)
+
+    paths = sebplt.video.list_image_slices(wildcard)
+    assert len(paths) == len(contents)
+
+    runs = sebplt.video.find_runs_of_identical_images(paths)
+    assert runs == [(paths[0], 3), (paths[3], 1), (paths[4], 2)]
+
+    concat_path = os.path.join(tmp_path, "video.ffconcat")
+    sebplt.video.write_ffconcat(
+        path=concat_path, runs=runs, frames_per_second=10
+    )
+    with open(concat_path, "rt") as f:
+        lines = f.read().splitlines()
+    assert lines[0] == "ffconcat version 1.0"
+    assert lines[2] == "duration 0.300000"
+    assert lines[-1] == lines[-3]
+
+
+def test_collapsed_frames_are_passed_to_ffmpeg_as_ffconcat(
+    tmp_path, monkeypatch
+):
+    wildcard = os.path.join(tmp_path, "%06d.png")
+    for i, content in enumerate([b"a", b"a", b"b"]):
+        with open(wildcard % i, "wb") as f:
+            f.write(content)
+
+    calls = []
+
+    def fake_call(args, **kwargs):
+        calls.append(args)
+        return 0
+
+    monkeypatch.setattr(sebplt.video.subprocess, "call", fake_call)
+    rc = sebplt.video.write_video_from_image_slices(
+        image_sequence_wildcard_path=wildcard,
+        output_path=os.path.join(tmp_path, "video.mov"),
+        frames_per_second=25,
+        collapse_duplicate_frames=True,
+    )
+    assert rc == 0
+    assert len(calls) == 1
+    args = calls[0]
+
+    concat_path = os.path.join(tmp_path, "video.ffconcat")
+    assert os.path.exists(concat_path)
+    i = args.index("-i")
+    assert args[i - 4 : i + 2] == [
+        "-f",
+        "concat",
+        "-safe",
+        "0",
+        "-i",
+        concat_path,
+    ]
+    assert args[args.index("-fps_mode") + 1] == "vfr"
+    assert "-framerate" not in args
+    assert args[-1] == os.path.join(tmp_path, "video.mov")
+
+    with open(concat_path, "rt") as f:
+        lines = f.read().splitlines()
+    assert lines[2] == "duration 0.080000"
+    assert lines[4] == "duration 0.040000"
@@ -0,0 +1,174 @@
+import io
+import multiprocessing
+import numpy as np
+import matplotlib
+from matplotlib.transforms import Bbox
+
+# Matplotlib simplifies paths after clipping them to the canvas. A path
+# crossing a tile's edge is then simplified differently in each tile.
+TILE_RC_PARAMS = {"path.simplify": False}
+
+
+def render_tiled(
+    plot,
+    path,
+    style,
+    dpi=240,
+    tile_rows=1024,
+    tile_cols=1024,
+    tile_margin=16,
+    num_processes=None,
+):
+    """
+    Renders a figure tile by tile into a memory-mapped image.
+
+    Each tile is rendered in a worker-process which creates the figure,
+    calls plot(fig), and renders only the pixels of its tile. The tiles are
+    written directly into the memory-mapped output. Peak memory is bounded
+    by the size of a tile times the number of processes and not by the size
+    of the figure.
+
+    The tiles are rendered with TILE_RC_PARAMS, i.e. without simplification
+    of paths. Compared to a single canvas rendered with the same rcParams,
+    pixels along the seams differ at most by a few levels of antialiasing.
+
+    Parameters
+    ----------
+    plot : callable
+            Called as plot(fig) to draw into the figure. Must be picklable,
+            e.g. a function defined at the top-level of a module.
+    path : str, path
+            Path to write the image to. An .npy file of dtype uint8 and
+            shape (rows, cols, 4) (RGBA).
+    style : dict
+            The style of the figure, e.g. FIGURE_16_9. See figure().
+    dpi : float
+            See figure().
+    tile_rows : int
+            Number of pixel-rows in a tile.
+    tile_cols : int
+            Number of pixel-columns in a tile.
+    tile_margin : int
+            Number of pixels each tile is rendered beyond its edges and
+            cropped away afterwards to avoid artifacts along the seams.
+    num_processes : int
+            Number of worker-processes. Default is the number of cpus.
+
+    Returns
+    -------
+    image : numpy.memmap (rows, cols, 4)
+            The image opened read-only.
+    """
+    assert tile_rows > 0
+    assert tile_cols > 0
+    assert tile_margin >= 0
+    rows, cols = _get_figure_rows_cols(style=style, dpi=dpi)
+
+    image = np.lib.format.open_memmap(
+        path, mode="w+", dtype=np.uint8, shape=(rows, cols, 4)
+    )
+    del image
+
+    jobs = []
+    for row_start in range(0, rows, tile_rows):
+        for col_start in range(0, cols, tile_cols):
+            jobs.append(
+                {
+                    "plot": plot,
+                    "path": path,
+                    "style": style,
+                    "dpi": dpi,
+                    "row_start": row_start,
+                    "row_stop": min(rows, row_start + tile_rows),
+                    "col_start": col_start,
+                    "col_stop": min(cols, col_start + tile_cols),
+                    "margin": tile_margin,
+                }
+            )
+
+    with multiprocessing.Pool(processes=num_processes) as pool:
+        for _ in pool.imap_unordered(_render_tile, jobs):
+            pass
+
+    return np.load(path, mmap_mode="r")
+
+
+def _get_figure_rows_cols(style, dpi):
+    from . import figure, close
+
+    fig = figure(style=style, dpi=dpi)
+    cols, rows = fig.canvas.get_width_height()
+    close(fig)
+    return rows, cols
+
+
+def _render_tile(job):
+    with matplotlib.rc_context(TILE_RC_PARAMS):
+        tile = _render_tile_rgba(job)
+
+    image = np.load(job["path"], mmap_mode="r+")
+    image[
+        job["row_start"] : job["row_stop"],
+        job["col_start"] : job["col_stop"],
+    ] = tile
+    image.flush()
+    del image
+
+
+def _render_tile_rgba(job):
+    from . import figure, close
+
+    fig = figure(style=job["style"], dpi=job["dpi"])
+    job["plot"](fig)
+    cols, rows = fig.canvas.get_width_height()
+    _dpi = fig.dpi
+
+    # Each tile is rendered with a margin of overlapping pixels which is
+    # cropped away afterwards. Without it, artists clipped at the edge of
+    # the canvas differ from the full figure in the pixels along the seams.
+    # The extent is in pixels with the origin in the lower left.
+    margin = job["margin"]
+    x_start = _exact_pixel(job["col_start"] - margin, _dpi, step=-1)
+    x_stop = _exact_pixel(job["col_stop"] + margin, _dpi, step=+1)
+    y_start = _exact_pixel(rows - job["row_stop"] - margin, _dpi, step=-1)
+    y_stop = _exact_pixel(rows - job["row_start"] + margin, _dpi, step=+1)
+
+    # bbox_inches crops the canvas so that only the tile is allocated and
+    # rendered. Matplotlib multiplies it with the dpi again, and its edges
+    # must map back to integer pixels exactly or the tile is shifted by a
+    # fraction of a pixel.
+    tile_inches = Bbox.from_extents(
+        x_start / _dpi,
+        y_start / _dpi,
+        x_stop / _dpi,
+        y_stop / _dpi,
+    )
+    buff = io.BytesIO()
+    fig.savefig(
+        buff,
+        format="rgba",
+        dpi=_dpi,
+        bbox_inches=tile_inches,
+        pad_inches=0.0,
+    )
+    close(fig)
+
+    tile_shape = (y_stop - y_start, x_stop - x_start, 4)
+    tile = np.frombuffer(buff.getvalue(), dtype=np.uint8)
+    assert tile.size == np.prod(tile_shape), "Tile has unexpected size."
+    tile = tile.reshape(tile_shape)
+    row_offset = rows - y_stop
+    return tile[
+        job["row_start"] - row_offset : job["row_stop"] - row_offset,
+        job["col_start"] - x_start : job["col_stop"] - x_start,
+    ]
+
+
+def _exact_pixel(pixel, dpi, step):
+    """
+    Returns the first pixel, starting at pixel and going in step, which is
+    exactly pixel again after converting it to inch and back.
+    """
+    while (pixel / dpi) * dpi != pixel:
+        pixel += step
+    return pixel
@@ -1,4 +1,5 @@
 import os
+import hashlib
 import subprocess
 
 
@@ -7,6 +8,7 @@ def write_video_from_image_slices(
     output_path,
     frames_per_second=30,
     threads=1,
+    collapse_duplicate_frames=False,
 ):
     """
     Writes an h264 video.mov from an image-sequence
@@ -21,23 +23,44 @@ def write_video_from_image_slices(
             Number of frames per second in video.
     threads : int
             The number of compute-threads to be used.
+    collapse_duplicate_frames : bool
+            If True, runs of identical images are encoded only once with the
+            duration of the whole run (variable frame-rate). The runs are
+            passed to ffmpeg in an ffconcat-list written next to the video.
     """
     outpath = os.path.splitext(output_path)[0]
     o_path = outpath + ".stdour"
     e_path = outpath + ".stderr"
     v_path = outpath + ".mov"
+    c_path = outpath + ".ffconcat"
+
+    if collapse_duplicate_frames:
+        runs = find_runs_of_identical_images(
+            image_paths=list_image_slices(image_sequence_wildcard_path)
+        )
+        write_ffconcat(
+            path=c_path, runs=runs, frames_per_second=frames_per_second
+        )
+        input_args = ["-f", "concat", "-safe", "0", "-i", c_path]
+        input_args += ["-fps_mode", "vfr"]
+    else:
+        input_args = [
+            "-framerate",
+            str(int(frames_per_second)),
+            "-f",
+            "image2",
+            "-i",
+            image_sequence_wildcard_path,
+        ]
 
     with open(o_path, "w") as stdout, open(e_path, "w") as stderr:
         rc = subprocess.call(
             [
                 "ffmpeg",
                 "-y",  # force overwriting of existing output file
-                "-framerate",
-                str(int(frames_per_second)),
-                "-f",
-                "image2",
-                "-i",
-                image_sequence_wildcard_path,
+            ]
+            + input_args
+            + [
                 "-c:v",
                 "h264",
                 # '-s', '1920x1080', # sample images down to FullHD 1080p
@@ -54,3 +77,69 @@ def write_video_from_image_slices(
         )
 
     return rc
+
+
+def list_image_slices(image_sequence_wildcard_path, start_number=None):
+    """
+    Returns the paths of the image-sequence in the order of their numbers.
+    Like ffmpeg, the sequence starts at the first existing number in
+    [0, 4] unless start_number is given, and ends before the first missing
+    number.
+    """
+    if start_number is None:
+        for start_number in range(5):
+            if os.path.exists(image_sequence_wildcard_path % start_number):
+                break
+
+    paths = []
+    number = start_number
+    while os.path.exists(image_sequence_wildcard_path % number):
+        paths.append(image_sequence_wildcard_path % number)
+        number += 1
+    return paths
+
+
+def find_runs_of_identical_images(image_paths):
+    """
+    Returns a list of (path, num_frames) where consecutive images with
+    identical content are collapsed into one run.
+    Images are compared by a hash of their files.
+    """
+    runs = []
+    last_digest = None
+    for path in image_paths:
+        digest = _hash_file(path)
+        if runs and digest == last_digest:
+            runs[-1] = (runs[-1][0], runs[-1][1] + 1)
+        else:
+            runs.append((path, 1))
+        last_digest = digest
+    return runs
+
+
+def write_ffconcat(path, runs, frames_per_second):
+    """
+    Writes an ffconcat-list for ffmpeg's concat-demuxer where each run of
+    (path, num_frames) is shown for num_frames / frames_per_second.
+    """
+    with open(path, "wt") as f:
+        f.write("ffconcat version 1.0\n")
+        for image_path, num_frames in runs:
+            f.write(f"file '{_ffconcat_escape(image_path)}'\n")
+            f.write(f"duration {num_frames / frames_per_second:.6f}\n")
+        if runs:
+            # The concat-demuxer ignores the duration of the last entry
+            # unless the last file is listed once more.
+            f.write(f"file '{_ffconcat_escape(runs[-1][0])}'\n")
+
+
+def _ffconcat_escape(path):
+    return os.path.abspath(path).replace("'", "'\\''")
+
+
+def _hash_file(path, chunk_size=1024 * 1024):
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.digest()